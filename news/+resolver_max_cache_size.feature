@@ -0,0 +1 @@
+`OmegaConf.register_new_resolver()` now accepts a `max_cache_size` parameter to bound the cache of resolvers registered with `use_cache=True` (least recently used outputs are evicted)
@@ -1,4 +1,5 @@
 import copy
+import functools
 import os
 import pathlib
 import re
@@ -34,18 +35,13 @@ try:
 except ImportError:  # pragma: no cover
     attr = None  # type: ignore # pragma: no cover
 
-try:
-    from yaml import CSafeLoader
-
-    BaseLoader = CSafeLoader
-except ImportError:  # pragma: no cover
+# Use the libyaml C bindings when PyYAML was built with them, they are
+# several times faster than the pure Python implementation.
+if yaml.__with_libyaml__:
+    BaseLoader = yaml.CSafeLoader
+    BaseDumper = yaml.CDumper
+else:  # pragma: no cover
     BaseLoader = yaml.SafeLoader
-
-try:
-    from yaml import CDumper
-
-    BaseDumper = CDumper
-except ImportError:  # pragma: no cover
     BaseDumper = yaml.Dumper
 
 NoneType: Type[None] = type(None)
@@ -136,6 +132,7 @@ def yaml_is_bool(b: str) -> bool:
     return b in YAML_BOOL_TYPES
 
 
+@functools.lru_cache(maxsize=1)
 def get_yaml_loader() -> Any:
     class OmegaConfLoader(BaseLoader):  # type: ignore
         def construct_mapping(self, node: yaml.Node, deep: bool = False) -> Any:
@@ -193,6 +190,25 @@ def get_yaml_loader() -> Any:
     return loader
 
 
+# Identifiers are plain YAML scalars: unless claimed by an implicit resolver
+# (booleans, null), they load as strings equal to themselves.
+YAML_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def is_yaml_identifier(st: str) -> bool:
+    """
+    Return True if `st` would be loaded by the YAML loader as the string `st`
+    itself, which allows callers to skip running the YAML parser on it.
+    """
+    if YAML_IDENTIFIER.fullmatch(st) is None:
+        return False
+    # Like `yaml.resolver.Resolver.resolve()`, also consider the wildcard
+    # resolvers, registered under the `None` key.
+    implicit_resolvers = get_yaml_loader().yaml_implicit_resolvers
+    resolvers = implicit_resolvers.get(st[0], []) + implicit_resolvers.get(None, [])
+    return not any(regexp.match(st) for _tag, regexp in resolvers)
+
+
 def _get_class(path: str) -> type:
     from importlib import import_module
 
@@ -1008,6 +1024,11 @@ def split_key(key: str) -> List[str]:
         ".a.b[c].d" -> ["", "a", "b", "c", "d"]
         "[a].b"     -> ["a", "b"]
     """
+    # Optimization for the common case of keys without the getitem syntax:
+    # they are split exactly like `key.split(".")` would, without any regex.
+    if "[" not in key:
+        return key.split(".")
+
     # Obtain the first part of the key (in docstring examples: a, a, .a, '')
     first = KEY_PATH_HEAD.match(key)
     assert first is not None
@@ -66,6 +66,23 @@ class Metadata:
         if self.flags is None:
             self.flags = {}
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Metadata":
+        # Metadata is deep-copied for every node of a copied config, which makes
+        # the generic (reduce-based) deepcopy a bottleneck. Types, keys and
+        # booleans are immutable and can be shared: only the flags and the
+        # resolver cache need to be copied.
+        cls = type(self)
+        res = cls.__new__(cls)
+        memo[id(self)] = res
+        res.__dict__.update(self.__dict__)
+        if self.flags is not None:
+            res.flags = dict(self.flags)
+        if self.resolver_cache:
+            res.resolver_cache = copy.deepcopy(self.resolver_cache, memo=memo)
+        else:
+            res.resolver_cache = defaultdict(dict)
+        return res
+
     @property
     def type_hint(self) -> Union[Type[Any], Any]:
         """Compute `type_hint` from `self.optional` and `self.ref_type`"""
@@ -8,21 +8,23 @@ import pathlib
 import sys
 import warnings
 from collections import defaultdict
-from contextlib import contextmanager, nullcontext
+from contextlib import ContextDecorator, nullcontext
 from enum import Enum
 from textwrap import dedent
 from typing import (
     IO,
     Any,
     Callable,
+    ContextManager,
     Dict,
-    Generator,
+    Generic,
     Iterable,
     List,
     Optional,
     Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
     overload,
 )
@@ -32,6 +34,7 @@ import yaml
 from . import DictConfig, DictKeyType, ListConfig
 from ._utils import (
     _DEFAULT_MARKER_,
+    BUILTIN_VALUE_TYPES,
     _ensure_container,
     _get_value,
     format_and_raise,
@@ -39,6 +42,7 @@ from ._utils import (
     get_list_element_type,
     get_omega_conf_dumper,
     get_type_of,
+    get_yaml_loader,
     is_attr_class,
     is_dataclass,
     is_dict_annotation,
@@ -50,6 +54,7 @@ from ._utils import (
     is_structured_config,
     is_tuple_annotation,
     is_union_annotation,
+    is_yaml_identifier,
     split_key,
     type_str,
 )
@@ -77,6 +82,9 @@ MISSING: Any = "???"
 
 Resolver = Callable[..., Any]
 
+NodeT = TypeVar("NodeT", bound=Node)
+ContainerT = TypeVar("ContainerT", bound=Container)
+
 
 def II(interpolation: str) -> Any:
     """
@@ -178,10 +186,10 @@ class OmegaConf:
 
     @staticmethod
     def load(file_: Union[str, pathlib.Path, IO[Any]]) -> Union[DictConfig, ListConfig]:
-        from ._utils import get_yaml_loader
-
         if isinstance(file_, (str, pathlib.Path)):
-            with io.open(os.path.abspath(file_), "r", encoding="utf-8") as f:
+            # Let the YAML reader decode the raw bytes itself, rather than
+            # going through a text wrapper.
+            with io.open(os.path.abspath(file_), "rb") as f:
                 obj = yaml.load(f, Loader=get_yaml_loader())
         elif getattr(file_, "read", None):
             obj = yaml.load(file_, Loader=get_yaml_loader())
@@ -196,6 +204,10 @@ class OmegaConf:
         ret: Union[DictConfig, ListConfig]
         if obj is None:
             ret = OmegaConf.create()
+        elif isinstance(obj, str):
+            # The document is a single scalar: it has already been parsed, do
+            # not let `create()` parse it as YAML a second time.
+            ret = OmegaConf.create({obj: None})
         else:
             ret = OmegaConf.create(obj)
         return ret
@@ -213,12 +225,17 @@ class OmegaConf:
         """
         if is_dataclass(config) or is_attr_class(config):
             config = OmegaConf.create(config)
-        data = OmegaConf.to_yaml(config, resolve=resolve)
+        container = _to_yaml_container(config, resolve=resolve)
         if isinstance(f, (str, pathlib.Path)):
+            # The YAML is fully rendered before the file is opened (and thus
+            # truncated), so that an existing file is left untouched on error.
+            data = _dump_yaml(container)
             with io.open(os.path.abspath(f), "w", encoding="utf-8") as file:
                 file.write(data)
         elif hasattr(f, "write"):
-            f.write(data)
+            # File objects are owned by the caller: dump into them directly
+            # rather than materializing the YAML as a string first.
+            _dump_yaml(container, f)
             f.flush()
         else:
             raise TypeError("Unexpected file type")
@@ -355,9 +372,13 @@ class OmegaConf:
             args: Tuple[Any, ...],
             args_str: Tuple[str, ...],
         ) -> Any:
-            cache = OmegaConf.get_cache(config)[name]
-            # "Un-escape " spaces and commas.
-            args_unesc = [x.replace(r"\ ", " ").replace(r"\,", ",") for x in args_str]
+            cache = config._metadata.resolver_cache[name]
+            key = args_str
+            val = cache.get(key, _DEFAULT_MARKER_)
+            if val is not _DEFAULT_MARKER_:
+                return val
+
+            args_unesc = [_unescape_legacy_resolver_arg(x) for x in args_str]
 
             # Nested interpolations behave in a potentially surprising way with
             # legacy resolvers (they remain as strings, e.g., "${foo}"). If any
@@ -374,9 +395,7 @@ class OmegaConf:
                     f"`register_new_resolver()` instead (see "
                     f"https://github.com/omry/omegaconf/issues/426 for migration instructions)."  # noqa: E231
                 )
-            key = args_str
-            val = cache[key] if key in cache else resolver(*args_unesc)
-            cache[key] = val
+            val = cache[key] = resolver(*args_unesc)
             return val
 
         # noinspection PyProtectedMember
@@ -389,6 +408,7 @@ class OmegaConf:
         *,
         replace: bool = False,
         use_cache: bool = False,
+        max_cache_size: Optional[int] = None,
     ) -> None:
         """
         Register a resolver.
@@ -406,11 +426,21 @@ class OmegaConf:
             based only on the string literals representing the resolver arguments, e.g.,
             ${foo:${bar}} will always return the same value regardless of the value of
             ``bar`` if the cache is enabled for ``foo``.
+        :param max_cache_size: Maximum number of outputs cached per config object when
+            ``use_cache=True``. Once reached, the least recently used output is evicted
+            (and computed again on its next use). Defaults to ``None`` (no limit).
         """
         if not callable(resolver):
             raise TypeError("resolver must be callable")
         if not name:
             raise ValueError("cannot use an empty resolver name")
+        if max_cache_size is not None:
+            if not use_cache:
+                raise ValueError("max_cache_size requires use_cache=True")
+            if max_cache_size < 1:
+                raise ValueError(
+                    f"max_cache_size must be a positive integer, got {max_cache_size}"
+                )
 
         if not replace and OmegaConf.has_resolver(name):
             raise ValueError(f"resolver '{name}' is already registered")
@@ -432,34 +462,75 @@ class OmegaConf:
         pass_node = _should_pass("_node_")
         pass_root = _should_pass("_root_")
 
-        def resolver_wrapper(
-            config: BaseContainer,
-            parent: Container,
-            node: Node,
-            args: Tuple[Any, ...],
-            args_str: Tuple[str, ...],
-        ) -> Any:
-            if use_cache:
-                cache = OmegaConf.get_cache(config)[name]
-                try:
-                    return cache[args_str]
-                except KeyError:
-                    pass
-
-            # Call resolver.
-            kwargs: Dict[str, Node] = {}
-            if pass_parent:
-                kwargs["_parent_"] = parent
-            if pass_node:
-                kwargs["_node_"] = node
-            if pass_root:
-                kwargs["_root_"] = config
-
-            ret = resolver(*args, **kwargs)
-
-            if use_cache:
+        # The wrapper is specialized at registration time, so that resolving an
+        # interpolation does not re-check options that cannot change.
+        # NOTE: `use_cache` excludes passing any special argument (see above).
+        if use_cache and max_cache_size is not None:
+
+            def resolver_wrapper(
+                config: BaseContainer,
+                parent: Container,
+                node: Node,
+                args: Tuple[Any, ...],
+                args_str: Tuple[str, ...],
+            ) -> Any:
+                # LRU cache relying on dicts preserving insertion order: the
+                # least recently used output is always the first entry.
+                cache = config._metadata.resolver_cache[name]
+                ret = cache.pop(args_str, _DEFAULT_MARKER_)
+                if ret is _DEFAULT_MARKER_:
+                    ret = resolver(*args)
+                    # The cache may already exceed the limit, e.g. if it was
+                    # filled before this resolver was registered or copied
+                    # from another config.
+                    while len(cache) >= max_cache_size:
+                        del cache[next(iter(cache))]
                 cache[args_str] = ret
-            return ret
+                return ret
+
+        elif use_cache:
+
+            def resolver_wrapper(
+                config: BaseContainer,
+                parent: Container,
+                node: Node,
+                args: Tuple[Any, ...],
+                args_str: Tuple[str, ...],
+            ) -> Any:
+                cache = config._metadata.resolver_cache[name]
+                ret = cache.get(args_str, _DEFAULT_MARKER_)
+                if ret is _DEFAULT_MARKER_:
+                    ret = cache[args_str] = resolver(*args)
+                return ret
+
+        elif not (pass_parent or pass_node or pass_root):
+
+            def resolver_wrapper(
+                config: BaseContainer,
+                parent: Container,
+                node: Node,
+                args: Tuple[Any, ...],
+                args_str: Tuple[str, ...],
+            ) -> Any:
+                return resolver(*args)
+
+        else:
+
+            def resolver_wrapper(
+                config: BaseContainer,
+                parent: Container,
+                node: Node,
+                args: Tuple[Any, ...],
+                args_str: Tuple[str, ...],
+            ) -> Any:
+                kwargs: Dict[str, Node] = {}
+                if pass_parent:
+                    kwargs["_parent_"] = parent
+                if pass_node:
+                    kwargs["_node_"] = node
+                if pass_root:
+                    kwargs["_root_"] = config
+                return resolver(*args, **kwargs)
 
         # noinspection PyProtectedMember
         BaseContainer._resolvers[name] = resolver_wrapper
@@ -503,7 +574,24 @@ class OmegaConf:
 
     @staticmethod
     def set_cache(conf: BaseContainer, cache: Dict[str, Any]) -> None:
-        conf._metadata.resolver_cache = copy.deepcopy(cache)
+        # The cache maps resolver names to {args: value} dicts. Cached values are
+        # deep-copied like the rest of the cache, except for immutable primitives
+        # (the common case) which can safely be shared.
+        memo: Dict[int, Any] = {}
+        conf._metadata.resolver_cache = defaultdict(
+            dict,
+            {
+                name: {
+                    args: (
+                        value
+                        if type(value) in BUILTIN_VALUE_TYPES
+                        else copy.deepcopy(value, memo=memo)
+                    )
+                    for args, value in values.items()
+                }
+                for name, values in cache.items()
+            },
+        )
 
     @staticmethod
     def clear_cache(conf: BaseContainer) -> None:
@@ -542,8 +630,6 @@ class OmegaConf:
         :param keys: keys to preserve in the copy
         :return: The masked ``DictConfig`` object.
         """
-        from .dictconfig import DictConfig
-
         if not isinstance(conf, DictConfig):
             raise ValueError("masked_copy is only supported for DictConfig")
 
@@ -638,20 +724,14 @@ class OmegaConf:
 
     @staticmethod
     def is_list(obj: Any) -> bool:
-        from . import ListConfig
-
         return isinstance(obj, ListConfig)
 
     @staticmethod
     def is_dict(obj: Any) -> bool:
-        from . import DictConfig
-
         return isinstance(obj, DictConfig)
 
     @staticmethod
     def is_config(obj: Any) -> bool:
-        from . import Container
-
         return isinstance(obj, Container)
 
     @staticmethod
@@ -769,15 +849,8 @@ class OmegaConf:
         :param sort_keys: If True, will print dict keys in sorted order. default False.
         :return: A string containing the yaml representation.
         """
-        cfg = _ensure_container(cfg)
-        container = OmegaConf.to_container(cfg, resolve=resolve, enum_to_str=True)
-        return yaml.dump(  # type: ignore
-            container,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=sort_keys,
-            Dumper=get_omega_conf_dumper(),
-        )
+        container = _to_yaml_container(cfg, resolve=resolve)
+        return _dump_yaml(container, sort_keys=sort_keys)  # type: ignore
 
     @staticmethod
     def resolve(cfg: Container) -> None:
@@ -835,13 +908,22 @@ class OmegaConf:
         flags: Optional[Dict[str, bool]] = None,
     ) -> Union[DictConfig, ListConfig]:
         try:
-            from ._utils import get_yaml_loader
-            from .dictconfig import DictConfig
-            from .listconfig import ListConfig
-
             if obj is _DEFAULT_MARKER_:
                 obj = {}
+
+            # Fast path for plain containers, the most common inputs: they
+            # carry no typing information, so the generic dispatch below would
+            # only compute the default (Any) key and element types.
+            input_type = type(obj)
+            if input_type is dict:
+                return DictConfig(content=obj, parent=parent, flags=flags)
+            elif input_type is list or input_type is tuple:
+                return ListConfig(content=obj, parent=parent, flags=flags)
+
             if isinstance(obj, str):
+                if is_yaml_identifier(obj):
+                    # Same result as below, without running the YAML parser.
+                    return OmegaConf.create({obj: None}, parent=parent, flags=flags)
                 obj = yaml.load(obj, Loader=get_yaml_loader())
                 if obj is None:
                     return OmegaConf.create({}, parent=parent, flags=flags)
@@ -952,58 +1034,108 @@ class OmegaConf:
         ]
     ]:
         # noinspection PyProtectedMember
-        return (
-            BaseContainer._resolvers[name] if name in BaseContainer._resolvers else None
-        )
+        return BaseContainer._resolvers.get(name)
 
 
 # register all default resolvers
 register_default_resolvers()
 
 
-@contextmanager
 def flag_override(
-    config: Node,
+    config: NodeT,
     names: Union[List[str], str],
     values: Union[List[Optional[bool]], Optional[bool]],
-) -> Generator[Node, None, None]:
+) -> ContextManager[NodeT]:
     if isinstance(names, str):
         names = [names]
     if values is None or isinstance(values, bool):
         values = [values]
 
-    prev_states = [config._get_node_flag(name) for name in names]
-
-    try:
-        config._set_flag(names, values)
-        yield config
-    finally:
-        config._set_flag(names, prev_states)
+    return _FlagOverride(config, names, values)
 
 
-@contextmanager
-def read_write(config: Node) -> Generator[Node, None, None]:
-    prev_state = config._get_node_flag("readonly")
-    try:
-        OmegaConf.set_readonly(config, False)
-        yield config
-    finally:
-        OmegaConf.set_readonly(config, prev_state)
+def read_write(config: NodeT) -> ContextManager[NodeT]:
+    return _FlagOverride(config, ["readonly"], [False])
 
 
-@contextmanager
-def open_dict(config: Container) -> Generator[Container, None, None]:
-    prev_state = config._get_node_flag("struct")
-    try:
-        OmegaConf.set_struct(config, False)
-        yield config
-    finally:
-        OmegaConf.set_struct(config, prev_state)
+def open_dict(config: ContainerT) -> ContextManager[ContainerT]:
+    return _FlagOverride(config, ["struct"], [False])
 
 
 # === private === #
 
 
+class _FlagOverride(ContextDecorator, Generic[NodeT]):
+    """
+    Context manager setting flags of a node on entry, and restoring their
+    previous state on exit. Like a `@contextmanager`, it can also be used as a
+    function decorator.
+
+    This is a plain class rather than a `@contextmanager` generator since it
+    is used on hot paths (e.g. every merge and struct-mode assignment).
+    """
+
+    __slots__ = ("config", "names", "values", "prev_states")
+
+    def __init__(
+        self, config: NodeT, names: List[str], values: List[Optional[bool]]
+    ) -> None:
+        self.config = config
+        self.names = names
+        self.values = values
+
+    def __enter__(self) -> NodeT:
+        config = self.config
+        self.prev_states = [config._get_node_flag(name) for name in self.names]
+        try:
+            config._set_flag(self.names, self.values)
+        except BaseException:
+            config._set_flag(self.names, self.prev_states)
+            raise
+        return config
+
+    def __exit__(self, *args: Any) -> None:
+        self.config._set_flag(self.names, self.prev_states)
+
+    def _recreate_cm(self) -> "_FlagOverride[NodeT]":
+        # Each decorated call gets its own instance (and saved flag states),
+        # so that decorated functions may be re-entered.
+        return _FlagOverride(self.config, self.names, self.values)
+
+
+def _to_yaml_container(cfg: Any, resolve: bool) -> Any:
+    cfg = _ensure_container(cfg)
+    return OmegaConf.to_container(cfg, resolve=resolve, enum_to_str=True)
+
+
+def _dump_yaml(
+    container: Any, stream: Optional[IO[Any]] = None, sort_keys: bool = False
+) -> Any:
+    """
+    Dump a primitive container as YAML, into `stream` if provided.
+    :return: the YAML string if `stream` is None, None otherwise.
+    """
+    return yaml.dump(
+        container,
+        stream,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=sort_keys,
+        Dumper=get_omega_conf_dumper(),
+    )
+
+
+def _unescape_legacy_resolver_arg(arg: str) -> str:
+    # "Un-escape" spaces and commas.
+    # Plain `str.replace()` is used on purpose: on such short strings it is
+    # an order of magnitude faster than a (precompiled) regex substitution.
+    # Most arguments contain no escape sequence at all: a single scan for a
+    # backslash is enough to return them unchanged.
+    if "\\" not in arg:
+        return arg
+    return arg.replace(r"\ ", " ").replace(r"\,", ",")
+
+
 def _node_wrap(
     parent: Optional[Box],
     is_optional: bool,
@@ -1127,9 +1259,6 @@ def _maybe_wrap(
 def _select_one(
     c: Container, key: str, throw_on_missing: bool, throw_on_type_error: bool = True
 ) -> Tuple[Optional[Node], Union[str, int]]:
-    from .dictconfig import DictConfig
-    from .listconfig import ListConfig
-
     ret_key: Union[str, int] = key
     assert isinstance(c, Container), f"Unexpected type: {c}"
     if c._is_none():
@@ -1,6 +1,6 @@
 import random
 import re
-from typing import Any
+from typing import Any, Dict, List
 
 from pytest import mark, param, raises, warns
 
@@ -130,6 +130,65 @@ def test_resolver_cache_1(restore_resolvers: Any) -> None:
     assert c.k == c.k
 
 
+def test_resolver_cache_max_size(restore_resolvers: Any) -> None:
+    calls: List[str] = []
+
+    def resolver(x: str) -> str:
+        calls.append(x)
+        return x
+
+    OmegaConf.register_new_resolver("lru", resolver, use_cache=True, max_cache_size=2)
+    c = OmegaConf.create({"a": "${lru:a}", "b": "${lru:b}", "c": "${lru:c}"})
+    assert (c.a, c.b, c.a) == ("a", "b", "a")
+    assert calls == ["a", "b"]
+
+    # `b` is the least recently used output: it is evicted to make room for `c`.
+    assert c.c == "c"
+    assert list(OmegaConf.get_cache(c)["lru"]) == [("a",), ("c",)]
+    assert (c.a, c.b) == ("a", "b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_resolver_cache_max_size_prefilled(restore_resolvers: Any) -> None:
+    OmegaConf.register_new_resolver("lru", lambda x: x, use_cache=True)
+    src = OmegaConf.create({f"k{i}": f"${{lru:{i}}}" for i in range(10)})
+    for i in range(10):
+        assert src[f"k{i}"] == i
+    assert len(OmegaConf.get_cache(src)["lru"]) == 10
+
+    OmegaConf.register_new_resolver(
+        "lru", lambda x: x, use_cache=True, max_cache_size=2, replace=True
+    )
+    dst = OmegaConf.create({"k": "${lru:new}"})
+    OmegaConf.copy_cache(src, dst)
+    for cfg in [src, dst]:
+        cfg.new = "${lru:new}"
+        assert cfg.new == "new"
+        assert list(OmegaConf.get_cache(cfg)["lru"]) == [("9",), ("new",)]
+
+
+@mark.parametrize(
+    "kwargs, expected",
+    [
+        param(
+            {"max_cache_size": 10},
+            "max_cache_size requires use_cache=True",
+            id="no_cache",
+        ),
+        param(
+            {"use_cache": True, "max_cache_size": 0},
+            "max_cache_size must be a positive integer, got 0",
+            id="zero",
+        ),
+    ],
+)
+def test_resolver_cache_max_size_error(
+    restore_resolvers: Any, kwargs: Dict[str, Any], expected: str
+) -> None:
+    with raises(ValueError, match=re.escape(expected)):
+        OmegaConf.register_new_resolver("lru", lambda x: x, **kwargs)
+
+
 def test_resolver_cache_1_legacy(restore_resolvers: Any) -> None:
     OmegaConf.legacy_register_resolver("random", lambda _: random.randint(0, 10000000))
     c = OmegaConf.create({"k": "${random:_}"})
@@ -332,6 +391,32 @@ def test_copy_cache(restore_resolvers: Any) -> None:
     assert c3.k == c1.k
 
 
+def test_set_cache_copies_cache(restore_resolvers: Any) -> None:
+    OmegaConf.register_new_resolver(
+        "random", lambda _: random.randint(0, 10000000), use_cache=True
+    )
+    c1 = OmegaConf.create({"k": "${random:__}"})
+    assert c1.k == c1.k
+
+    c2 = OmegaConf.create({"k": "${random:__}", "other": "${random:other}"})
+    OmegaConf.set_cache(c2, OmegaConf.get_cache(c1))
+    assert c2.k == c1.k
+    assert c2.other == c2.other
+    assert ("other",) not in OmegaConf.get_cache(c1)["random"]
+
+
+def test_set_cache_copies_cached_objects(restore_resolvers: Any) -> None:
+    OmegaConf.register_new_resolver("obj", lambda _: User(), use_cache=True)
+    flags = {"allow_objects": True}
+    c1 = OmegaConf.create({"k": "${obj:__}"}, flags=flags)
+    assert c1.k is c1.k
+
+    c2 = OmegaConf.create({"k": "${obj:__}"}, flags=flags)
+    OmegaConf.copy_cache(c1, c2)
+    assert c2.k == c1.k
+    assert c2.k is not c1.k
+
+
 def test_clear_cache(restore_resolvers: Any) -> None:
     OmegaConf.register_new_resolver("random", lambda _: random.randint(0, 10000000))
     c = OmegaConf.create({"k": "${random:__}"})
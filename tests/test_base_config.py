@@ -1,6 +1,6 @@
 import copy
 from contextlib import nullcontext
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from pytest import mark, param, raises
 
@@ -247,6 +247,26 @@ class TestDeepCopy:
                 c2.foo = 42
 
 
+def test_deepcopy_metadata_is_independent() -> None:
+    c1 = OmegaConf.create({"a": {"b": 1}})
+    OmegaConf.set_readonly(c1.a, True)
+    OmegaConf.get_cache(c1)["foo"][("x",)] = [1, 2]
+    c2 = copy.deepcopy(c1)
+
+    assert c2._metadata == c1._metadata
+    assert c2.a._metadata == c1.a._metadata
+    assert c2.a._metadata.flags is not c1.a._metadata.flags
+    assert OmegaConf.get_cache(c2)["foo"][("x",)] == [1, 2]
+    assert OmegaConf.get_cache(c2)["foo"][("x",)] is not (
+        OmegaConf.get_cache(c1)["foo"][("x",)]
+    )
+
+    OmegaConf.set_readonly(c2.a, False)
+    OmegaConf.clear_cache(c2)
+    assert c1.a._get_node_flag("readonly") is True
+    assert OmegaConf.get_cache(c1)["foo"] == {("x",): [1, 2]}
+
+
 def test_deepcopy_after_del() -> None:
     # make sure that deepcopy does not resurrect deleted fields (as it once did, believe it or not).
     c1 = OmegaConf.create(dict(foo=[1, 2, 3], bar=10))
@@ -410,6 +430,34 @@ def test_open_dict_restore(flag_name: str, ctx: Any) -> None:
     assert not cfg.foo._get_node_flag(flag_name)
 
 
+@mark.parametrize(
+    "flag_name,ctx",
+    [
+        ("struct", open_dict),
+        ("readonly", read_write),
+        ("readonly", lambda c: flag_override(c, "readonly", False)),
+    ],
+)
+def test_flag_context_as_decorator(flag_name: str, ctx: Any) -> None:
+    cfg = OmegaConf.create({"foo": 10})
+    cfg._set_flag(flag_name, True)
+    calls: List[int] = []
+
+    def body() -> None:
+        assert cfg._get_node_flag(flag_name) is False
+        cfg.foo = 20
+        if not calls:
+            # Re-enter the decorated function.
+            calls.append(1)
+            func()
+            assert cfg._get_node_flag(flag_name) is False
+
+    func: Callable[[], None] = ctx(cfg)(body)
+    func()
+    assert cfg.foo == 20
+    assert cfg._get_node_flag(flag_name) is True
+
+
 @mark.parametrize(
     "copy_method",
     [
@@ -5,6 +5,7 @@ import os
 import pathlib
 import pickle
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
@@ -13,6 +14,7 @@ from pytest import mark, param, raises
 from omegaconf import MISSING, DictConfig, ListConfig, Node, OmegaConf, UnionNode
 from omegaconf._utils import get_type_hint
 from omegaconf.base import Box
+from omegaconf.errors import InterpolationKeyError
 from tests import (
     Color,
     NestedContainers,
@@ -31,16 +33,13 @@ from tests import (
 def save_load_from_file(conf: Any, resolve: bool, expected: Any) -> None:
     if expected is None:
         expected = conf
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="wt", delete=False, encoding="utf-8"
-        ) as fp:
-            OmegaConf.save(conf, fp.file, resolve=resolve)
-        with io.open(os.path.abspath(fp.name), "rt", encoding="utf-8") as handle:
-            c2 = OmegaConf.load(handle)
-        assert c2 == expected
-    finally:
-        os.unlink(fp.name)
+    # File objects are exercised in memory, actual files are covered by
+    # `save_load_from_filename()` below.
+    buf = io.StringIO()
+    OmegaConf.save(conf, buf, resolve=resolve)
+    buf.seek(0)
+    c2 = OmegaConf.load(buf)
+    assert c2 == expected
 
 
 def save_load_from_filename(
@@ -130,6 +129,30 @@ def test_save_illegal_type() -> None:
         OmegaConf.save(OmegaConf.create(), 1000)  # type: ignore
 
 
+@mark.parametrize(
+    "cfg, resolve, expected",
+    [
+        param({"a": "${missing}"}, True, raises(InterpolationKeyError), id="resolve"),
+        param(
+            {"x": 1, "a": threading.Lock()},
+            False,
+            raises(TypeError),
+            id="dump",
+        ),
+    ],
+)
+def test_save_error_keeps_file(
+    tmpdir: str, cfg: Dict[str, Any], resolve: bool, expected: Any
+) -> None:
+    path = Path(tmpdir) / "test.yaml"
+    path.write_text("a: 1\n")
+    conf = OmegaConf.create(cfg, flags={"allow_objects": True})
+
+    with expected:
+        OmegaConf.save(conf, path, resolve=resolve)
+    assert path.read_text() == "a: 1\n"
+
+
 @mark.parametrize("obj", [param({"a": "b"}, id="dict"), param([1, 2, 3], id="list")])
 def test_pickle(obj: Any) -> None:
     with tempfile.TemporaryFile() as fp:
@@ -156,6 +179,24 @@ def test_load_empty_file(tmpdir: str) -> None:
         assert OmegaConf.load(f) == {}
 
 
+@mark.parametrize(
+    "content,expected",
+    [
+        param("foo", {"foo": None}, id="plain_scalar"),
+        param("'a: 1'", {"a: 1": None}, id="quoted_yaml"),
+        param("'null'", {"null": None}, id="quoted_null"),
+    ],
+)
+def test_load_scalar_file(tmpdir: str, content: str, expected: Any) -> None:
+    path = Path(tmpdir) / "test.yaml"
+    path.write_text(content)
+
+    assert OmegaConf.load(path) == expected
+
+    with open(path) as f:
+        assert OmegaConf.load(f) == expected
+
+
 @mark.parametrize(
     "input_,node,element_type,key_type,optional,ref_type",
     [
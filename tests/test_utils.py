@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import attr
+import yaml
 from pytest import mark, param, raises
 
 from omegaconf import DictConfig, ListConfig, Node, OmegaConf, UnionNode, _utils
@@ -1076,6 +1077,8 @@ def test_marker_string_representation() -> None:
         ("foo[bar]", ["foo", "bar"]),
         (".foo", ["", "foo"]),
         ("..foo", ["", "", "foo"]),
+        ("foo.", ["foo", ""]),
+        ("foo..bar", ["foo", "", "bar"]),
         (".foo[bar]", ["", "foo", "bar"]),
         ("[foo]", ["foo"]),
         ("[foo][bar]", ["foo", "bar"]),
@@ -1476,3 +1479,39 @@ def test_resolve_optional_support_pep_604() -> None:
 )
 def test_resolve_forward(type_: Any, expected: Any) -> None:
     assert _resolve_forward(type_, "builtins") == expected
+
+
+def test_get_yaml_loader_is_cached() -> None:
+    assert _utils.get_yaml_loader() is _utils.get_yaml_loader()
+
+
+@mark.parametrize(
+    "st, expected",
+    [
+        param("foo", True, id="identifier"),
+        param("foo_bar1", True, id="identifier_with_digits"),
+        param("_", True, id="underscore"),
+        param("y", True, id="y"),
+        param("true", False, id="bool"),
+        param("Off", False, id="bool_off"),
+        param("null", False, id="null"),
+        param("1a", False, id="leading_digit"),
+        param("a=1", False, id="not_identifier"),
+        param("a b", False, id="space"),
+        param("", False, id="empty"),
+    ],
+)
+def test_is_yaml_identifier(st: str, expected: bool) -> None:
+    assert _utils.is_yaml_identifier(st) == expected
+    if expected:
+        assert yaml.load(st, Loader=_utils.get_yaml_loader()) == st
+
+
+def test_is_yaml_identifier_wildcard_resolver(mocker: Any) -> None:
+    loader = _utils.get_yaml_loader()
+    resolvers = dict(loader.yaml_implicit_resolvers)
+    resolvers[None] = [("tag:example.com,2024:foo", re.compile("^foo$"))]
+    mocker.patch.object(loader, "yaml_implicit_resolvers", resolvers)
+
+    assert not _utils.is_yaml_identifier("foo")
+    assert _utils.is_yaml_identifier("bar")